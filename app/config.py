@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
@@ -12,6 +12,32 @@ class FeedConfig:
     link: str
     language: str
     max_items: int
+    max_bytes: int | None = None
+    max_item_bytes: int | None = None
+
+
+DESCRIPTION_MODES = ("raw", "text", "drop")
+
+
+@dataclass
+class DescriptionPolicy:
+    mode: Literal["raw", "text", "drop"] = "raw"
+    max_length: int | None = None
+
+
+@dataclass
+class FetchConfig:
+    max_response_bytes: int = 10_000_000
+    deadline_seconds: float = 60.0
+
+
+@dataclass
+class FilterConfig:
+    include_keywords: list[str] = field(default_factory=list)
+    exclude_keywords: list[str] = field(default_factory=list)
+    include_patterns: list[str] = field(default_factory=list)
+    exclude_patterns: list[str] = field(default_factory=list)
+    max_age_days: int | None = None
 
 
 @dataclass
@@ -22,12 +48,90 @@ class SourceConfig:
     enabled: bool
     channel_id: str | None = None
     rss_url: str | None = None
+    filters: FilterConfig = field(default_factory=FilterConfig)
+    description_policy: DescriptionPolicy = field(default_factory=DescriptionPolicy)
+    fetch: FetchConfig = field(default_factory=FetchConfig)
 
 
 @dataclass
 class AppConfig:
     feed: FeedConfig
     sources: list[SourceConfig]
+    filters: FilterConfig = field(default_factory=FilterConfig)
+    fetch: FetchConfig = field(default_factory=FetchConfig)
+
+
+def _load_fetch_config(data: dict | None, defaults: FetchConfig) -> FetchConfig:
+    """Build FetchConfig from a `fetch` mapping, falling back to defaults."""
+    data = data or {}
+    return FetchConfig(
+        max_response_bytes=data.get("max_response_bytes", defaults.max_response_bytes),
+        deadline_seconds=data.get("deadline_seconds", defaults.deadline_seconds),
+    )
+
+
+def _load_filter_config(data: dict | None) -> FilterConfig:
+    """Build FilterConfig from a `filters` mapping (global or per-source)."""
+    data = data or {}
+    return FilterConfig(
+        include_keywords=_load_string_list(data, "include_keywords"),
+        exclude_keywords=_load_string_list(data, "exclude_keywords"),
+        include_patterns=_load_string_list(data, "include_patterns"),
+        exclude_patterns=_load_string_list(data, "exclude_patterns"),
+        max_age_days=_load_max_age_days(data),
+    )
+
+
+def _load_max_age_days(data: dict) -> int | None:
+    max_age_days = data.get("max_age_days")
+    if max_age_days is not None and not _is_positive_int(max_age_days):
+        raise ValueError(
+            f"Error: filters.max_age_days must be a positive integer, got {max_age_days!r}"
+        )
+    return max_age_days
+
+
+def _load_size_limit(feed_data: dict, key: str) -> int | None:
+    value = feed_data.get(key)
+    if value is not None and not _is_positive_int(value):
+        raise ValueError(f"Error: feed.{key} must be a positive integer, got {value!r}")
+    return value
+
+
+def _is_positive_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def _load_string_list(data: dict, key: str) -> list[str]:
+    """Read a list of non-empty strings; a single string is treated as a one-item list."""
+    value = data.get(key)
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list):
+        raise ValueError(f"Error: filters.{key} must be a list of strings, got {value!r}")
+    for entry in value:
+        if not isinstance(entry, str) or not entry:
+            raise ValueError(f"Error: filters.{key} entries must be non-empty strings: {entry!r}")
+    return value
+
+
+def _load_description_policy(data: dict | None) -> DescriptionPolicy:
+    """Build DescriptionPolicy from a source's `description_policy` mapping."""
+    data = data or {}
+    mode = data.get("mode", "raw")
+    if mode not in DESCRIPTION_MODES:
+        raise ValueError(
+            f"Error: description_policy.mode must be one of {', '.join(DESCRIPTION_MODES)}, "
+            f"got {mode!r}"
+        )
+    max_length = data.get("max_length")
+    if max_length is not None and not _is_positive_int(max_length):
+        raise ValueError(
+            f"Error: description_policy.max_length must be a positive integer, got {max_length!r}"
+        )
+    return DescriptionPolicy(mode=mode, max_length=max_length)
 
 
 def load_config(config_path: Path = Path("config.yaml")) -> AppConfig:
@@ -48,8 +152,12 @@ def load_config(config_path: Path = Path("config.yaml")) -> AppConfig:
         link=feed_data["link"],
         language=feed_data["language"],
         max_items=feed_data.get("max_items", 100),
+        max_bytes=_load_size_limit(feed_data, "max_bytes"),
+        max_item_bytes=_load_size_limit(feed_data, "max_item_bytes"),
     )
 
+    fetch_config = _load_fetch_config(data.get("fetch"), FetchConfig())
+
     sources = []
     for source_data in data.get("sources", []):
         source = SourceConfig(
@@ -59,7 +167,15 @@ def load_config(config_path: Path = Path("config.yaml")) -> AppConfig:
             enabled=source_data.get("enabled", True),
             channel_id=source_data.get("channel_id"),
             rss_url=source_data.get("rss_url"),
+            filters=_load_filter_config(source_data.get("filters")),
+            description_policy=_load_description_policy(source_data.get("description_policy")),
+            fetch=_load_fetch_config(source_data.get("fetch"), fetch_config),
         )
         sources.append(source)
 
-    return AppConfig(feed=feed_config, sources=sources)
+    return AppConfig(
+        feed=feed_config,
+        sources=sources,
+        filters=_load_filter_config(data.get("filters")),
+        fetch=fetch_config,
+    )
@@ -0,0 +1,108 @@
+import calendar
+import time
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_MONTH_NUMBERS = {name.lower(): f"{number:02d}" for number, name in enumerate(_MONTHS, start=1)}
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_UTC_ZONES = {"GMT", "UT", "UTC", "Z"}
+
+
+def parse_datetime(value: str) -> datetime | None:
+    """Parse an ISO 8601 or RFC 822 date string to a timezone-aware datetime.
+
+    ISO 8601 and fixed-layout RFC 822 are handled by the C implementation of
+    `datetime.fromisoformat`; only unusual RFC 822 forms (e.g. named US time
+    zones) fall back to the much slower `email.utils`. Naive results are
+    assumed to be UTC. Returns None if unparseable.
+    """
+    value = value.strip()
+    if not value:
+        return None
+
+    if _looks_like_iso(value):
+        dt = _parse_iso(value)
+    else:
+        dt = _parse_rfc822_fast(value)
+        if dt is None:
+            dt = _parse_rfc822(value)
+    if dt is None:
+        return None
+
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt
+
+
+def _looks_like_iso(value: str) -> bool:
+    # "2024-01-15..." vs "Mon, 15 Jan 2024 ..." / "15 Jan 2024 ..."
+    return len(value) >= 10 and value[:4].isdigit() and value[4] == "-"
+
+
+def _parse_iso(value: str) -> datetime | None:
+    try:
+        # Python 3.11+ accepts "Z" and most ISO 8601 forms natively
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_rfc822_fast(value: str) -> datetime | None:
+    """Parse fixed-layout RFC 822 dates by rewriting them as ISO 8601.
+
+    Handles "[Mon, ]15 Jan 2024 10:30[:00] GMT|+0900", which covers nearly
+    all feeds, so the C `fromisoformat` does the parsing. Returns None for
+    anything else so the caller can fall back to `email.utils`.
+    """
+    if value[3:5] == ", ":
+        value = value[5:]
+    parts = value.split(" ")
+    if len(parts) != 5:
+        return None
+    day, month_name, year, clock, zone = parts
+
+    month = _MONTH_NUMBERS.get(month_name.lower())
+    if month is None or len(year) != 4 or len(day) > 2:
+        return None
+    if zone in _UTC_ZONES:
+        zone = "+00:00"
+    elif len(zone) != 5 or zone[0] not in "+-":
+        return None
+
+    try:
+        return datetime.fromisoformat(f"{year}-{month}-{day:0>2}T{clock}{zone}")
+    except ValueError:
+        return None
+
+
+def _parse_rfc822(value: str) -> datetime | None:
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def from_struct_time(value: time.struct_time) -> datetime:
+    """Convert a UTC struct_time (as produced by feedparser) to a datetime."""
+    return datetime.fromtimestamp(calendar.timegm(value), tz=UTC)
+
+
+def format_rfc822(value: datetime) -> str:
+    """Format a timezone-aware datetime as an RFC 822 date string.
+
+    Produces the same output as `email.utils.format_datetime` without its
+    intermediate time tuple and string formatting steps.
+    """
+    offset = value.utcoffset()
+    if offset is None:
+        return format_datetime(value)
+
+    minutes = int(offset.total_seconds()) // 60
+    sign = "+" if minutes >= 0 else "-"
+    hours, minutes = divmod(abs(minutes), 60)
+    return (
+        f"{_WEEKDAYS[value.weekday()]}, {value.day:02d} {_MONTHS[value.month - 1]} "
+        f"{value.year:04d} {value.hour:02d}:{value.minute:02d}:{value.second:02d} "
+        f"{sign}{hours:02d}{minutes:02d}"
+    )
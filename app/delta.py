@@ -0,0 +1,254 @@
+import json
+import logging
+import os
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from xml.etree.ElementTree import Element, ParseError, fromstring
+
+logger = logging.getLogger(__name__)
+
+# Item child elements compared to decide whether an item was updated
+ITEM_FIELDS = ("title", "link", "description", "pubDate", "source")
+
+ItemSnapshot = dict[str, dict[str, str]]
+
+
+@dataclass
+class FeedDelta:
+    """Items added, updated or removed between two feed builds, keyed by GUID."""
+
+    added: list[dict[str, str]] = field(default_factory=list)
+    updated: list[dict[str, str]] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.updated or self.removed)
+
+
+def parse_feed_items(xml_str: str) -> ItemSnapshot:
+    """Parse an RSS 2.0 XML string into a GUID -> item fields mapping."""
+    root = fromstring(xml_str)
+    items = {}
+    for item_elem in root.iter("item"):
+        guid = item_elem.findtext("guid")
+        if not guid:
+            continue
+        items[guid] = _item_fields(guid, item_elem)
+    return items
+
+
+def _item_fields(guid: str, item_elem: Element) -> dict[str, str]:
+    fields = {"guid": guid}
+    for name in ITEM_FIELDS:
+        fields[name] = item_elem.findtext(name) or ""
+    source_elem = item_elem.find("source")
+    fields["source_url"] = source_elem.get("url", "") if source_elem is not None else ""
+    return fields
+
+
+def compute_delta(
+    previous: ItemSnapshot,
+    current: ItemSnapshot,
+    failed_source_urls: Collection[str] = (),
+) -> tuple[FeedDelta, ItemSnapshot]:
+    """Compare two builds and return the per-GUID changes.
+
+    Items from sources that failed this run are not reported as removed;
+    they are carried over into the returned snapshot instead, so they are
+    not reported as added again once the source recovers.
+
+    Returns:
+        The delta and the snapshot to compare the next build against.
+    """
+    delta = FeedDelta()
+    snapshot = dict(current)
+
+    for guid, fields in current.items():
+        old_fields = previous.get(guid)
+        if old_fields is None:
+            delta.added.append(fields)
+        elif old_fields != fields:
+            delta.updated.append(fields)
+
+    for guid, fields in previous.items():
+        if guid in current:
+            continue
+        if fields.get("source_url") and fields["source_url"] in failed_source_urls:
+            snapshot[guid] = fields
+        else:
+            delta.removed.append(guid)
+
+    return delta, snapshot
+
+
+def _write_json(path: Path, data) -> None:
+    """Write JSON via a temporary file so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+class DeltaWriter:
+    """Writer for per-run delta files, the cursor index and the item snapshot.
+
+    Each non-empty delta is written to `<output_dir>/<sequence>.json` and
+    registered in `<output_dir>/index.json`. Consumers remember the last
+    sequence they processed and fetch only the entries listed after it; if
+    their cursor is older than `oldest_sequence`, they should resync from
+    the full feed. `snapshot.json` holds the items the next build is
+    compared against.
+    """
+
+    INDEX_FILENAME = "index.json"
+    SNAPSHOT_FILENAME = "snapshot.json"
+
+    def __init__(self, output_dir: Path, retention: int = 168):
+        self.output_dir = output_dir
+        self.retention = retention
+
+    @property
+    def index_path(self) -> Path:
+        return self.output_dir / self.INDEX_FILENAME
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.output_dir / self.SNAPSHOT_FILENAME
+
+    def load_index(self) -> dict:
+        """Load the cursor index, rebuilding it from delta files if unreadable."""
+        if not self.index_path.exists():
+            return self._rebuild_index()
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            if not (
+                isinstance(index, dict)
+                and isinstance(index.get("latest_sequence"), int)
+                and isinstance(index.get("deltas"), list)
+            ):
+                raise ValueError("unexpected index format")
+            return index
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read {self.index_path}, rebuilding from delta files: {e}")
+            return self._rebuild_index()
+
+    def _delta_files(self) -> list[Path]:
+        if not self.output_dir.exists():
+            return []
+        return sorted(path for path in self.output_dir.glob("*.json") if path.stem.isdigit())
+
+    def _rebuild_index(self) -> dict:
+        delta_files = self._delta_files()
+        deltas = []
+        for path in delta_files:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    payload = json.load(f)
+                deltas.append(
+                    {
+                        "sequence": payload["sequence"],
+                        "generated_at": payload["generated_at"],
+                        "file": path.name,
+                        "added": len(payload["added"]),
+                        "updated": len(payload["updated"]),
+                        "removed": len(payload["removed"]),
+                    }
+                )
+            except (OSError, ValueError, TypeError, KeyError) as e:
+                logger.warning(f"Skipping unreadable delta file {path}: {e}")
+
+        # Never reuse a sequence number, even for a file that couldn't be read
+        latest = max((int(path.stem) for path in delta_files), default=0)
+        return {
+            "latest_sequence": latest,
+            "oldest_sequence": deltas[0]["sequence"] if deltas else 0,
+            "deltas": deltas,
+        }
+
+    def load_previous_items(self, feed_path: Path) -> ItemSnapshot:
+        """Load the items to compare against.
+
+        Uses the snapshot from the previous run, falling back to parsing the
+        previous feed (e.g. on the first run), or an empty mapping.
+        """
+        if self.snapshot_path.exists():
+            try:
+                with open(self.snapshot_path, encoding="utf-8") as f:
+                    snapshot = json.load(f)
+                if not (
+                    isinstance(snapshot, dict)
+                    and all(isinstance(fields, dict) for fields in snapshot.values())
+                ):
+                    raise ValueError("unexpected snapshot format")
+                return snapshot
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read {self.snapshot_path}, using previous feed: {e}")
+
+        if feed_path.exists():
+            try:
+                return parse_feed_items(feed_path.read_text(encoding="utf-8"))
+            except ParseError as e:
+                logger.warning(f"Could not parse previous feed, treating as empty: {e}")
+
+        return {}
+
+    def write(
+        self,
+        delta: FeedDelta,
+        snapshot: ItemSnapshot,
+        now: datetime | None = None,
+    ) -> int | None:
+        """Write a delta file, then the index, then the snapshot.
+
+        The snapshot is written last so that an interrupted run reports the
+        same changes again rather than losing them.
+
+        Returns:
+            The assigned sequence number, or None if the delta was empty.
+        """
+        if delta.is_empty():
+            return None
+
+        now = now or datetime.now(UTC)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        index = self.load_index()
+        sequence = index["latest_sequence"] + 1
+        filename = f"{sequence:08d}.json"
+
+        payload = {
+            "sequence": sequence,
+            "generated_at": now.isoformat(),
+            "added": delta.added,
+            "updated": delta.updated,
+            "removed": delta.removed,
+        }
+        _write_json(self.output_dir / filename, payload)
+
+        deltas = index["deltas"] + [
+            {
+                "sequence": sequence,
+                "generated_at": payload["generated_at"],
+                "file": filename,
+                "added": len(delta.added),
+                "updated": len(delta.updated),
+                "removed": len(delta.removed),
+            }
+        ]
+
+        # Drop the oldest deltas beyond the retention window
+        expired, deltas = deltas[: -self.retention], deltas[-self.retention :]
+        for entry in expired:
+            (self.output_dir / entry["file"]).unlink(missing_ok=True)
+
+        index = {
+            "latest_sequence": sequence,
+            "oldest_sequence": deltas[0]["sequence"],
+            "deltas": deltas,
+        }
+        _write_json(self.index_path, index)
+        _write_json(self.snapshot_path, snapshot)
+
+        return sequence
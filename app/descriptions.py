@@ -0,0 +1,114 @@
+import re
+from dataclasses import replace
+from html.parser import HTMLParser
+
+from app.config import DESCRIPTION_MODES, DescriptionPolicy
+from app.models import NormalizedItem
+
+ELLIPSIS = "…"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class _TextExtractor(HTMLParser):
+    """HTML parser that collects text content, skipping script/style blocks.
+
+    Inline tags are removed without adding whitespace; block-level tags
+    separate the text around them.
+    """
+
+    SKIP_TAGS = {"script", "style"}
+    BLOCK_TAGS = {
+        "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+        "figcaption", "figure", "footer", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+        "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "td", "th", "tr",
+        "ul",
+    }  # fmt: skip
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def strip_html(text: str) -> str:
+    """Convert HTML to plain text with collapsed whitespace."""
+    if "<" not in text and "&" not in text:
+        return _WHITESPACE_RE.sub(" ", text).strip()
+
+    extractor = _TextExtractor()
+    extractor.feed(text)
+    extractor.close()
+    return _WHITESPACE_RE.sub(" ", "".join(extractor.parts)).strip()
+
+
+def truncate(text: str, max_length: int) -> str:
+    """Truncate text to at most max_length characters at a word boundary.
+
+    An ellipsis is appended when text is cut (and counted in max_length).
+    Text without whitespace near the cut (e.g. Japanese) is cut hard.
+    """
+    if len(text) <= max_length:
+        return text
+    if max_length <= len(ELLIPSIS):
+        return text[:max_length]
+
+    cut = text[: max_length - len(ELLIPSIS)]
+    if not text[len(cut)].isspace():
+        boundary = cut.rfind(" ")
+        # Only back up to a word boundary if it doesn't discard most of the text
+        if boundary > len(cut) // 2:
+            cut = cut[:boundary]
+    return cut.rstrip() + ELLIPSIS
+
+
+def shorten(description: str, max_length: int) -> str:
+    """Shorten a description that may contain HTML to at most max_length characters.
+
+    Descriptions that already fit are returned unchanged (markup included);
+    longer ones are converted to text first so that no tag or entity is cut.
+    """
+    if len(description) <= max_length:
+        return description
+    return truncate(strip_html(description), max_length)
+
+
+def apply_description_policy(
+    items: list[NormalizedItem], policy: DescriptionPolicy
+) -> list[NormalizedItem]:
+    """Return items with descriptions rewritten according to the source's policy."""
+    if policy.mode not in DESCRIPTION_MODES:
+        raise ValueError(f"Unknown description_policy mode: {policy.mode}")
+    if policy.mode == "raw" and policy.max_length is None:
+        return items
+
+    result = []
+    for item in items:
+        description = item.description
+        if policy.mode == "drop":
+            description = None
+        elif description:
+            if policy.mode == "text":
+                description = strip_html(description)
+                if policy.max_length is not None:
+                    description = truncate(description, policy.max_length)
+            elif policy.max_length is not None:
+                description = shorten(description, policy.max_length)
+        result.append(replace(item, description=description or None))
+    return result
@@ -1,16 +1,24 @@
+import logging
+from dataclasses import replace
 from datetime import UTC, datetime
 from email.utils import format_datetime
 from xml.etree.ElementTree import Element, SubElement, tostring
+from xml.sax.saxutils import escape
 
 from app.config import FeedConfig
+from app.dates import format_rfc822
+from app.descriptions import strip_html, truncate
 from app.models import NormalizedItem
 
+logger = logging.getLogger(__name__)
+
 
 class FeedBuilder:
     """Builder for RSS 2.0 feed from normalized items."""
 
     def __init__(self, config: FeedConfig):
         self.config = config
+        self.item_count = 0
 
     def build(
         self,
@@ -25,6 +33,9 @@ class FeedBuilder:
 
         Returns:
             RSS 2.0 XML string.
+
+        Raises:
+            ValueError: If max_bytes is too small to fit any item.
         """
         source_urls = source_urls or {}
 
@@ -34,6 +45,24 @@ class FeedBuilder:
         # Limit to max_items
         limited_items = sorted_items[: self.config.max_items]
 
+        now = datetime.now(UTC)
+        if self.config.max_item_bytes is not None:
+            limited_items = self._fit_items(limited_items, source_urls)
+
+        xml_str = self._render(limited_items, source_urls, now)
+        if self.config.max_bytes is not None and _byte_size(xml_str) > self.config.max_bytes:
+            limited_items, xml_str = self._build_within_budget(limited_items, source_urls, now)
+
+        self.item_count = len(limited_items)
+        return xml_str
+
+    def _render(
+        self,
+        items: list[NormalizedItem],
+        source_urls: dict[str, str],
+        now: datetime,
+    ) -> str:
+        """Render items as an RSS 2.0 XML string."""
         # Build XML
         rss = Element("rss", version="2.0")
         channel = SubElement(rss, "channel")
@@ -45,27 +74,159 @@ class FeedBuilder:
         SubElement(channel, "language").text = self.config.language
 
         # Last build date
-        now = datetime.now(UTC)
         SubElement(channel, "lastBuildDate").text = format_datetime(now)
 
         # Items
-        for item in limited_items:
-            item_elem = SubElement(channel, "item")
-            SubElement(item_elem, "title").text = item.title
-            SubElement(item_elem, "link").text = item.url
-            SubElement(item_elem, "description").text = (
-                item.description or item.source_display_name
-            )
-            SubElement(item_elem, "pubDate").text = format_datetime(item.published_at)
-            guid = SubElement(item_elem, "guid", isPermaLink="true")
-            guid.text = item.url
-
-            # Source element
-            source_url = source_urls.get(item.source_id, "")
-            if source_url:
-                source_elem = SubElement(item_elem, "source", url=source_url)
-                source_elem.text = item.source_display_name
+        for item in items:
+            channel.append(self._render_item(item, source_urls))
 
         # Convert to string with XML declaration
         xml_str = tostring(rss, encoding="unicode")
         return '<?xml version="1.0" encoding="UTF-8"?>\n' + xml_str
+
+    def _render_item(self, item: NormalizedItem, source_urls: dict[str, str]) -> Element:
+        """Render a single <item> element."""
+        item_elem = Element("item")
+        SubElement(item_elem, "title").text = item.title
+        SubElement(item_elem, "link").text = item.url
+        SubElement(item_elem, "description").text = item.description or item.source_display_name
+        SubElement(item_elem, "pubDate").text = format_rfc822(item.published_at)
+        guid = SubElement(item_elem, "guid", isPermaLink="true")
+        guid.text = item.url
+
+        # Source element
+        source_url = source_urls.get(item.source_id, "")
+        if source_url:
+            source_elem = SubElement(item_elem, "source", url=source_url)
+            source_elem.text = item.source_display_name
+
+        return item_elem
+
+    def _item_size(self, item: NormalizedItem, source_urls: dict[str, str]) -> int:
+        return _byte_size(tostring(self._render_item(item, source_urls), encoding="unicode"))
+
+    def _fit_items(
+        self,
+        items: list[NormalizedItem],
+        source_urls: dict[str, str],
+    ) -> list[NormalizedItem]:
+        """Shorten descriptions so that each rendered item fits max_item_bytes.
+
+        The cap depends only on the item itself, so an item renders the same
+        regardless of which other items are in the run.
+        """
+        max_item_bytes = self.config.max_item_bytes
+        fitted_items = [self._fit_item(item, source_urls, max_item_bytes)[0] for item in items]
+        trimmed_count = sum(
+            fitted is not item for fitted, item in zip(fitted_items, items, strict=True)
+        )
+        if trimmed_count:
+            logger.info(
+                f"Applied max_item_bytes={max_item_bytes}: {trimmed_count} descriptions trimmed"
+            )
+        return fitted_items
+
+    def _build_within_budget(
+        self,
+        items: list[NormalizedItem],
+        source_urls: dict[str, str],
+        now: datetime,
+    ) -> tuple[list[NormalizedItem], str]:
+        """Render a feed that is over max_bytes so that it fits.
+
+        The largest items are trimmed first: every item larger than a common
+        cap has its description shortened to that cap, which is chosen as
+        high as the budget allows so smaller items are left untouched. Items
+        that still don't fit are dropped, oldest first.
+
+        Raises:
+            ValueError: If max_bytes is too small for even one item, so that
+                an empty feed isn't written (and reported as all removed).
+        """
+        max_bytes = self.config.max_bytes
+        header_size = _byte_size(self._render([], source_urls, now))
+        if header_size >= max_bytes:
+            raise ValueError(
+                f"max_bytes={max_bytes} is too small: the channel metadata alone "
+                f"is {header_size} bytes"
+            )
+        sizes = [self._item_size(item, source_urls) for item in items]
+        item_cap = _fair_share(sizes, max_bytes - header_size)
+
+        fitted_items = []
+        trimmed_count = 0
+        for index, item in enumerate(items):
+            if sizes[index] > item_cap:
+                fitted_item, sizes[index] = self._fit_item(item, source_urls, item_cap)
+                if fitted_item is not item:
+                    trimmed_count += 1
+                item = fitted_item
+            fitted_items.append(item)
+
+        # Drop oldest items if some items couldn't be shrunk to the cap
+        total = header_size
+        kept_count = 0
+        for size in sizes:
+            if total + size > max_bytes:
+                break
+            total += size
+            kept_count += 1
+        if kept_count == 0 and items:
+            raise ValueError(f"max_bytes={max_bytes} is too small to fit any item")
+        fitted_items = fitted_items[:kept_count]
+
+        xml_str = self._render(fitted_items, source_urls, now)
+        logger.info(
+            f"Applied max_bytes={max_bytes} ({item_cap} bytes per item at most): "
+            f"{trimmed_count} descriptions trimmed, {len(items) - kept_count} items "
+            f"dropped, final size {_byte_size(xml_str)} bytes"
+        )
+        return fitted_items, xml_str
+
+    def _fit_item(
+        self,
+        item: NormalizedItem,
+        source_urls: dict[str, str],
+        item_budget: int,
+    ) -> tuple[NormalizedItem, int]:
+        """Shorten an item's description so the rendered item fits item_budget bytes.
+
+        Returns:
+            The (possibly unchanged) item and its rendered size in bytes.
+        """
+        size = self._item_size(item, source_urls)
+        if size <= item_budget or not item.description:
+            return item, size
+
+        # Bytes left for the description text once the rest of the item is rendered
+        base_size = self._item_size(replace(item, description=None), source_urls)
+        allowance = item_budget - (base_size - _byte_size(escape(item.source_display_name)))
+
+        # Convert to text first so that no tag or entity is cut, then find the
+        # longest truncation whose escaped form fits
+        text = strip_html(item.description)
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if _byte_size(escape(truncate(text, mid))) <= allowance:
+                low = mid
+            else:
+                high = mid - 1
+
+        fitted_item = replace(item, description=truncate(text, low) or None)
+        return fitted_item, self._item_size(fitted_item, source_urls)
+
+
+def _byte_size(xml_str: str) -> int:
+    return len(xml_str.encode("utf-8"))
+
+
+def _fair_share(sizes: list[int], available: int) -> int:
+    """Return the largest cap such that sum(min(size, cap)) fits in available bytes."""
+    remaining = available
+    for index, size in enumerate(sorted(sizes)):
+        count = len(sizes) - index
+        if size * count > remaining:
+            return max(remaining // count, 0)
+        remaining -= size
+    return max(sizes, default=0)
@@ -0,0 +1,179 @@
+import re
+import string
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+
+from app.config import FilterConfig
+from app.models import NormalizedItem
+
+# One or more leading inline flag groups, e.g. "(?i)" or "(?i)(?s)"
+_LEADING_FLAGS_RE = re.compile(r"^((?:\(\?[aiLmsux]+\))+)")
+
+_ASCII_WORD_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
+
+class ItemFilter:
+    """Include/exclude filter for normalized items.
+
+    Global and per-source rules are merged and compiled once into a single
+    alternation regex per direction (include / exclude). Each rule becomes a
+    named group, so one `search` per item both decides the outcome and tells
+    which rule matched. Matching is case-insensitive against title and
+    description. Keywords match whole words where they start or end with an
+    ASCII letter, digit or underscore (so "PR" doesn't match "programming");
+    other keywords, e.g. Japanese ones, match anywhere.
+    """
+
+    def __init__(self, *configs: FilterConfig):
+        self.include_rules: list[str] = []
+        self.exclude_rules: list[str] = []
+        include_parts: list[str] = []
+        exclude_parts: list[str] = []
+        max_age_days: int | None = None
+
+        for config in configs:
+            for keyword in config.include_keywords:
+                expr = _keyword_expr(keyword)
+                self._add_rule(include_parts, self.include_rules, expr, keyword)
+            for pattern in config.include_patterns:
+                expr = self._prepare_pattern(pattern)
+                self._add_rule(include_parts, self.include_rules, expr, f"/{pattern}/")
+            for keyword in config.exclude_keywords:
+                expr = _keyword_expr(keyword)
+                self._add_rule(exclude_parts, self.exclude_rules, expr, keyword)
+            for pattern in config.exclude_patterns:
+                expr = self._prepare_pattern(pattern)
+                self._add_rule(exclude_parts, self.exclude_rules, expr, f"/{pattern}/")
+            # Later configs (per-source) override earlier ones (global)
+            if config.max_age_days is not None:
+                max_age_days = config.max_age_days
+
+        self.include_regex = self._compile(include_parts, "include")
+        self.exclude_regex = self._compile(exclude_parts, "exclude")
+        self.max_age = timedelta(days=max_age_days) if max_age_days is not None else None
+        self.hits: Counter[str] = Counter()
+
+    @staticmethod
+    def _prepare_pattern(pattern: str) -> str:
+        """Validate a user regex and make it safe to embed in the combined regex.
+
+        Leading inline flags such as "(?i)" are converted to a scoped group,
+        since global flags are only allowed at the start of the combined
+        regex. Numbered backreferences are rejected because the wrapping
+        groups shift group numbers.
+        """
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"Invalid filter pattern {pattern!r}: {e}") from e
+
+        if _has_numbered_backref(pattern):
+            raise ValueError(
+                f"Invalid filter pattern {pattern!r}: numbered backreferences are not "
+                "supported, use a named group and (?P=name) instead"
+            )
+
+        match = _LEADING_FLAGS_RE.match(pattern)
+        if match:
+            flags = "".join(dict.fromkeys(re.findall(r"[aiLmsux]", match.group(1))))
+            rest = pattern[match.end() :]
+            # In verbose mode a trailing "# comment" would swallow the closing paren
+            if "x" in flags:
+                rest += "\n"
+            pattern = f"(?{flags}:{rest})"
+        return pattern
+
+    @staticmethod
+    def _add_rule(parts: list[str], labels: list[str], expr: str, label: str) -> None:
+        if not expr:
+            raise ValueError("Empty filter keyword or pattern would match every item")
+        parts.append(f"(?P<_r{len(parts)}>{expr})")
+        labels.append(label)
+
+    @staticmethod
+    def _compile(parts: list[str], kind: str) -> re.Pattern | None:
+        if not parts:
+            return None
+        try:
+            return re.compile("|".join(parts), re.IGNORECASE)
+        except re.error as e:
+            raise ValueError(f"Invalid {kind} filter pattern: {e}") from e
+
+    def apply(
+        self, items: list[NormalizedItem], now: datetime | None = None
+    ) -> list[NormalizedItem]:
+        """Return items that pass all rules, updating per-rule hit counters."""
+        if self.include_regex is None and self.exclude_regex is None and self.max_age is None:
+            return items
+
+        cutoff = (now or datetime.now(UTC)) - self.max_age if self.max_age else None
+        kept = []
+
+        for item in items:
+            if cutoff is not None and item.published_at < cutoff:
+                self.hits["max_age_days"] += 1
+                continue
+
+            text = f"{item.title}\n{item.description or ''}"
+
+            if self.exclude_regex is not None:
+                match = self.exclude_regex.search(text)
+                if match:
+                    self.hits[f"exclude:{self._rule_label(match, self.exclude_rules)}"] += 1
+                    continue
+
+            if self.include_regex is not None:
+                match = self.include_regex.search(text)
+                if not match:
+                    self.hits["include:<no match>"] += 1
+                    continue
+                self.hits[f"include:{self._rule_label(match, self.include_rules)}"] += 1
+
+            kept.append(item)
+
+        return kept
+
+    @staticmethod
+    def _rule_label(match: re.Match, labels: list[str]) -> str:
+        # The outermost rule group closes last, so lastgroup names the rule
+        return labels[int(match.lastgroup[2:])]
+
+
+def _keyword_expr(keyword: str) -> str:
+    """Return a regex matching keyword literally, as a whole word at ASCII word edges.
+
+    Only ASCII word characters count as word boundaries, so that "Python"
+    still matches in "Python入門", where the Japanese text is also \\w.
+    """
+    expr = re.escape(keyword)
+    if keyword[:1] in _ASCII_WORD_CHARS:
+        expr = r"(?<![A-Za-z0-9_])" + expr
+    if keyword[-1:] in _ASCII_WORD_CHARS:
+        expr += r"(?![A-Za-z0-9_])"
+    return expr
+
+
+def _has_numbered_backref(pattern: str) -> bool:
+    """Return True if pattern contains a numbered backreference such as \\1."""
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            following = pattern[i + 1 : i + 2]
+            if not in_class and following and following in "123456789":
+                return True
+            i += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # A "]" right after "[" or "[^" is a literal, not the end of the class
+            if pattern[i + 1 : i + 2] == "^":
+                i += 1
+            if pattern[i + 1 : i + 2] == "]":
+                i += 1
+        i += 1
+    return False
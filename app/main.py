@@ -1,9 +1,14 @@
 import logging
+import os
 import sys
+from collections import Counter
 from pathlib import Path
 
-from app.config import SourceConfig, load_config
+from app.config import AppConfig, SourceConfig, load_config
+from app.delta import DeltaWriter, compute_delta, parse_feed_items
+from app.descriptions import apply_description_policy
 from app.feed_builder import FeedBuilder
+from app.filters import ItemFilter
 from app.models import NormalizedItem
 from app.sources.generic_rss import GenericRSSFetcher
 from app.sources.youtube import YouTubeFetcher
@@ -25,15 +30,32 @@ def create_fetcher(config: SourceConfig):
         raise ValueError(f"Unknown source type: {config.type}")
 
 
+def build_item_filters(config: AppConfig, sources: list[SourceConfig]) -> list[ItemFilter]:
+    """Compile each source's filter rules, so invalid rules fail before any fetch."""
+    try:
+        ItemFilter(config.filters)
+    except ValueError as e:
+        raise ValueError(f"Error: filters: {e}") from e
+
+    item_filters = []
+    for source in sources:
+        try:
+            item_filters.append(ItemFilter(config.filters, source.filters))
+        except ValueError as e:
+            raise ValueError(f"Error: sources.{source.id}.filters: {e}") from e
+    return item_filters
+
+
 def main():
     config_path = Path("config.yaml")
     output_path = Path("docs/feed.xml")
+    delta_dir = Path("docs/deltas")
 
     logger.info(f"Loading config from {config_path}")
 
     try:
         config = load_config(config_path)
-    except FileNotFoundError as e:
+    except (FileNotFoundError, ValueError) as e:
         print(str(e), file=sys.stderr)
         sys.exit(1)
 
@@ -41,21 +63,42 @@ def main():
     enabled_sources = [s for s in config.sources if s.enabled]
     logger.info(f"Processing {len(enabled_sources)} enabled sources...")
 
+    try:
+        item_filters = build_item_filters(config, enabled_sources)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+
     all_items: list[NormalizedItem] = []
     source_urls: dict[str, str] = {}
+    failed_source_urls: set[str] = set()
     success_count = 0
     fail_count = 0
+    filter_hits: Counter[str] = Counter()
 
-    for source in enabled_sources:
+    for source, item_filter in zip(enabled_sources, item_filters):
+        fetcher = None
         try:
             fetcher = create_fetcher(source)
             items = fetcher.fetch()
+            fetched_count = len(items)
+            items = item_filter.apply(items)
+            filter_hits.update(item_filter.hits)
+            items = apply_description_policy(items, source.description_policy)
             all_items.extend(items)
             source_urls[source.id] = fetcher.source_url
-            logger.info(f"[{source.type}] {source.id}: {len(items)} items fetched")
+            if len(items) != fetched_count:
+                logger.info(
+                    f"[{source.type}] {source.id}: {fetched_count} items fetched, "
+                    f"{len(items)} kept after filters"
+                )
+            else:
+                logger.info(f"[{source.type}] {source.id}: {len(items)} items fetched")
             success_count += 1
         except Exception as e:
             logger.error(f"[{source.type}] {source.id}: {e}")
+            if fetcher is not None:
+                failed_source_urls.add(fetcher.source_url)
             fail_count += 1
 
     logger.info(
@@ -63,6 +106,9 @@ def main():
         f"({fail_count} failed)"
     )
 
+    for rule, count in sorted(filter_hits.items()):
+        logger.info(f"Filter hits: {rule} = {count}")
+
     # If all sources failed, preserve existing feed
     if success_count == 0 and fail_count > 0:
         logger.warning("All sources failed. Preserving existing feed.xml")
@@ -70,15 +116,36 @@ def main():
 
     # Build feed
     builder = FeedBuilder(config.feed)
-    feed_xml = builder.build(all_items, source_urls)
+    try:
+        feed_xml = builder.build(all_items, source_urls)
+    except ValueError as e:
+        logger.error(f"{e}. Preserving existing feed.xml")
+        sys.exit(1)
+
+    # Write delta for downstream consumers before replacing feed.xml, so a
+    # failure here leaves the previous feed as the baseline for the next run
+    delta_writer = DeltaWriter(delta_dir)
+    previous_items = delta_writer.load_previous_items(output_path)
+    delta, snapshot = compute_delta(previous_items, parse_feed_items(feed_xml), failed_source_urls)
+    sequence = delta_writer.write(delta, snapshot)
+    if sequence is None:
+        logger.info("No item changes since previous build; no delta written")
+    else:
+        logger.info(
+            f"Writing delta #{sequence}: {len(delta.added)} added, "
+            f"{len(delta.updated)} updated, {len(delta.removed)} removed"
+        )
 
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Write feed
-    logger.info(f"Writing feed.xml with {min(len(all_items), config.feed.max_items)} items...")
-    with open(output_path, "w", encoding="utf-8") as f:
+    feed_size = len(feed_xml.encode("utf-8"))
+    logger.info(f"Writing feed.xml with {builder.item_count} items ({feed_size} bytes)...")
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
         f.write(feed_xml)
+    os.replace(tmp_path, output_path)
 
     logger.info("Done.")
 
@@ -1,5 +1,5 @@
-from .base import SourceFetcher
+from .base import ResponseLimitError, SourceFetcher
 from .generic_rss import GenericRSSFetcher
 from .youtube import YouTubeFetcher
 
-__all__ = ["SourceFetcher", "YouTubeFetcher", "GenericRSSFetcher"]
+__all__ = ["SourceFetcher", "ResponseLimitError", "YouTubeFetcher", "GenericRSSFetcher"]
@@ -1,12 +1,39 @@
+import threading
+import zlib
 from abc import ABC, abstractmethod
+from urllib.parse import urljoin
+
+import requests
 
 from app.config import SourceConfig
 from app.models import NormalizedItem
 
 
+class ResponseLimitError(Exception):
+    """Raised when a response exceeds the source's size or time limits."""
+
+
+class _FetchSession(requests.Session):
+    """Session that leaves redirects to the caller.
+
+    Even with allow_redirects=False, requests reads the body of a redirect
+    response in full (decompressing it) to prepare `Response.next`; reporting
+    no redirect target skips that.
+    """
+
+    def get_redirect_target(self, resp):
+        return None
+
+
 class SourceFetcher(ABC):
     """Base class for source fetchers."""
 
+    TIMEOUT = 30
+    CHUNK_SIZE = 1024
+    MAX_REDIRECTS = 5
+    # Only encodings we can decompress incrementally with a size bound
+    REQUEST_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
     def __init__(self, config: SourceConfig):
         self.config = config
 
@@ -22,3 +49,139 @@ class SourceFetcher(ABC):
     @property
     def display_name(self) -> str:
         return self.config.display_name
+
+    def _download(self, url: str) -> bytes:
+        """Download url within the source's size and time limits.
+
+        The request runs in a worker thread so that deadline_seconds bounds
+        the whole download, however slowly the server sends headers or body;
+        the socket timeout alone only bounds the gap between packets. On
+        timeout the fetch's session is closed, so its connection is discarded
+        rather than reused, and the worker stops at its next body read.
+
+        A worker still waiting for response headers cannot be interrupted: it
+        is left running (as a daemon thread, with its result discarded) until
+        the server finishes the headers or the socket timeout passes.
+
+        Raises:
+            ResponseLimitError: If the body exceeds max_response_bytes or the
+                deadline passes before the download completes.
+        """
+        deadline_seconds = self.config.fetch.deadline_seconds
+        state: dict = {}
+        cancelled = threading.Event()
+
+        def worker():
+            try:
+                state["body"] = self._get_body(url, state, cancelled)
+            except Exception as e:
+                state["error"] = e
+
+        thread = threading.Thread(target=worker, name=f"fetch-{self.source_id}", daemon=True)
+        thread.start()
+        thread.join(deadline_seconds)
+
+        if thread.is_alive():
+            cancelled.set()
+            session = state.get("session")
+            if session is not None:
+                session.close()
+            raise ResponseLimitError(f"Download exceeded deadline of {deadline_seconds}s")
+        if "error" in state:
+            raise state["error"]
+        return state["body"]
+
+    def _get_body(self, url: str, state: dict, cancelled: threading.Event) -> bytes:
+        """Request url, following redirects, and read the final response body.
+
+        Redirects are followed here rather than by requests, which reads each
+        redirect response's body in full (decompressing it) before moving on;
+        redirect responses are closed unread so that only the final body is
+        read, through _read_body and its limits.
+        """
+        with _FetchSession() as session:
+            state["session"] = session
+            for _ in range(self.MAX_REDIRECTS + 1):
+                response = session.get(
+                    url,
+                    timeout=min(self.TIMEOUT, self.config.fetch.deadline_seconds),
+                    headers=self.REQUEST_HEADERS,
+                    stream=True,
+                    allow_redirects=False,
+                )
+                if not response.is_redirect:
+                    return self._read_body(response, cancelled)
+
+                url = urljoin(response.url, response.headers["Location"])
+                response.close()
+                if cancelled.is_set():
+                    raise ResponseLimitError("Download cancelled after deadline")
+
+        raise ResponseLimitError(f"Too many redirects (> {self.MAX_REDIRECTS})")
+
+    def _read_body(self, response: requests.Response, cancelled: threading.Event) -> bytes:
+        """Read a streamed response body within the source's size limit.
+
+        The body is decompressed here rather than by urllib3 so that the
+        decoded size can be bounded chunk by chunk, which guards against
+        compression bombs.
+        """
+        max_bytes = self.config.fetch.max_response_bytes
+        try:
+            response.raise_for_status()
+
+            content_length = response.headers.get("Content-Length")
+            if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+                raise ResponseLimitError(
+                    f"Response too large: Content-Length {content_length} > {max_bytes} bytes"
+                )
+
+            decompressor = self._decompressor(response.headers.get("Content-Encoding", ""))
+            body = bytearray()
+            received = 0
+
+            # read1 returns as soon as any data arrives, so a cancelled
+            # download stops after the next packet rather than the next 1 KiB
+            while chunk := response.raw.read1(self.CHUNK_SIZE, decode_content=False):
+                if cancelled.is_set():
+                    raise ResponseLimitError("Download cancelled after deadline")
+
+                received += len(chunk)
+                if received > max_bytes:
+                    raise ResponseLimitError(f"Response too large: > {max_bytes} bytes")
+
+                if decompressor is None:
+                    body += chunk
+                    continue
+
+                # Decompress with a bounded output size per call
+                data = chunk
+                while data:
+                    body += decompressor.decompress(data, max_bytes + 1 - len(body))
+                    if len(body) > max_bytes:
+                        raise ResponseLimitError(
+                            f"Decompressed response too large: > {max_bytes} bytes"
+                        )
+                    data = decompressor.unconsumed_tail
+
+            if decompressor is not None:
+                body += decompressor.flush()
+                if len(body) > max_bytes:
+                    raise ResponseLimitError(
+                        f"Decompressed response too large: > {max_bytes} bytes"
+                    )
+
+            return bytes(body)
+        finally:
+            response.close()
+
+    @staticmethod
+    def _decompressor(content_encoding: str):
+        encoding = content_encoding.strip().lower()
+        if encoding in ("", "identity"):
+            return None
+        if encoding in ("gzip", "x-gzip"):
+            return zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if encoding == "deflate":
+            return zlib.decompressobj()
+        raise ResponseLimitError(f"Unsupported Content-Encoding: {content_encoding}")
@@ -1,10 +1,9 @@
-import time
-from datetime import UTC, datetime
+from datetime import datetime
 
 import feedparser
-import requests
 
 from app.config import SourceConfig
+from app.dates import from_struct_time, parse_datetime
 from app.models import NormalizedItem
 
 from .base import SourceFetcher
@@ -13,8 +12,6 @@ from .base import SourceFetcher
 class GenericRSSFetcher(SourceFetcher):
     """Fetcher for generic RSS/Atom feeds."""
 
-    TIMEOUT = 30
-
     def __init__(self, config: SourceConfig):
         super().__init__(config)
         if not config.rss_url:
@@ -22,10 +19,9 @@ class GenericRSSFetcher(SourceFetcher):
 
     def fetch(self) -> list[NormalizedItem]:
         """Fetch items from a generic RSS/Atom feed."""
-        response = requests.get(self.config.rss_url, timeout=self.TIMEOUT)
-        response.raise_for_status()
+        content = self._download(self.config.rss_url)
 
-        feed = feedparser.parse(response.content)
+        feed = feedparser.parse(content)
         items = []
 
         for entry in feed.entries:
@@ -49,22 +45,15 @@ class GenericRSSFetcher(SourceFetcher):
 
     def _parse_date(self, entry) -> datetime | None:
         """Parse date from feedparser entry."""
-        # feedparser provides parsed_time as time.struct_time
+        # feedparser provides parsed_time as time.struct_time in UTC
         time_struct = entry.get("published_parsed") or entry.get("updated_parsed")
         if time_struct:
-            timestamp = time.mktime(time_struct)
-            return datetime.fromtimestamp(timestamp, tz=UTC)
+            return from_struct_time(time_struct)
 
         # Fallback to string parsing
         date_str = entry.get("published") or entry.get("updated")
         if date_str:
-            try:
-                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=UTC)
-                return dt
-            except (ValueError, TypeError):
-                pass
+            return parse_datetime(date_str)
 
         return None
 
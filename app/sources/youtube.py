@@ -1,9 +1,9 @@
-from datetime import UTC, datetime
+from datetime import datetime
 
 import feedparser
-import requests
 
 from app.config import SourceConfig
+from app.dates import parse_datetime
 from app.models import NormalizedItem
 
 from .base import SourceFetcher
@@ -13,7 +13,6 @@ class YouTubeFetcher(SourceFetcher):
     """Fetcher for YouTube channels using the official RSS feed."""
 
     YOUTUBE_RSS_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-    TIMEOUT = 30
 
     def __init__(self, config: SourceConfig):
         super().__init__(config)
@@ -23,10 +22,9 @@ class YouTubeFetcher(SourceFetcher):
     def fetch(self) -> list[NormalizedItem]:
         """Fetch videos from YouTube channel RSS feed."""
         url = self.YOUTUBE_RSS_URL.format(channel_id=self.config.channel_id)
-        response = requests.get(url, timeout=self.TIMEOUT)
-        response.raise_for_status()
+        content = self._download(url)
 
-        feed = feedparser.parse(response.content)
+        feed = feedparser.parse(content)
         items = []
 
         for entry in feed.entries:
@@ -50,15 +48,7 @@ class YouTubeFetcher(SourceFetcher):
         """Parse date string to timezone-aware datetime."""
         if not date_str:
             return None
-        try:
-            # feedparser provides parsed time in time_struct format
-            # but we have the raw string, so parse it
-            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=UTC)
-            return dt
-        except (ValueError, TypeError):
-            return None
+        return parse_datetime(date_str)
 
     @property
     def source_url(self) -> str:
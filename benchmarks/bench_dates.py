@@ -0,0 +1,98 @@
+"""Micro-benchmark for date normalization and RFC 822 formatting.
+
+Compares the shared `app.dates` pipeline with the per-fetcher approach it
+replaced (try ISO 8601, fall back to `email.utils`, `format_datetime` for
+every item) over 100k distinct timestamps in the formats feeds actually use.
+Every timestamp is unique, as in a production run where each date is
+parsed once. The first ("cold") run is reported next to the best of the
+repeated ("warm") runs.
+
+Usage:
+    uv run python -m benchmarks.bench_dates
+"""
+
+import random
+import time
+import timeit
+from datetime import UTC, datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from app.dates import format_rfc822, parse_datetime
+
+COUNT = 100_000
+REPEAT = 5
+
+OFFSETS = [timezone(timedelta(hours=hours)) for hours in (0, 9, -5, 1, -8)]
+
+
+def make_timestamps(count: int) -> list[str]:
+    rng = random.Random(0)
+    base = datetime(2020, 1, 1, tzinfo=UTC)
+    formats = [
+        # YouTube / Atom
+        lambda dt: dt.isoformat(),
+        lambda dt: dt.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        lambda dt: dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}Z",
+        # RSS 2.0
+        lambda dt: format_datetime(dt.astimezone(UTC), usegmt=True),
+        lambda dt: format_datetime(dt),
+        lambda dt: format_datetime(dt)[5:],
+        # Named zone, handled by the email.utils fallback
+        lambda dt: format_datetime(dt.astimezone(UTC))[:-5] + "EST",
+    ]
+    seconds = rng.sample(range(5 * 365 * 86400), count)
+    return [
+        rng.choice(formats)(
+            (base + timedelta(seconds=s, milliseconds=rng.randrange(1000))).astimezone(
+                rng.choice(OFFSETS)
+            )
+        )
+        for s in seconds
+    ]
+
+
+def legacy_parse(value: str) -> datetime | None:
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt
+
+
+def measure(func) -> tuple[float, float]:
+    """Return (cold, warm) timings in seconds."""
+    started = time.perf_counter()
+    func()
+    cold = time.perf_counter() - started
+    warm = min(timeit.repeat(func, number=1, repeat=REPEAT))
+    return cold, warm
+
+
+def main():
+    timestamps = make_timestamps(COUNT)
+    assert len(set(timestamps)) == COUNT
+
+    parsed = [parse_datetime(value) for value in timestamps]
+    assert parsed == [legacy_parse(value) for value in timestamps]
+    assert [format_rfc822(dt) for dt in parsed] == [format_datetime(dt) for dt in parsed]
+
+    cases = {
+        "parse (legacy)": lambda: [legacy_parse(value) for value in timestamps],
+        "parse (app.dates)": lambda: [parse_datetime(value) for value in timestamps],
+        "format (format_datetime)": lambda: [format_datetime(dt) for dt in parsed],
+        "format (format_rfc822)": lambda: [format_rfc822(dt) for dt in parsed],
+    }
+
+    print(f"{COUNT} distinct timestamps, cold = first run, warm = best of {REPEAT}")
+    for name, func in cases.items():
+        cold, warm = measure(func)
+        print(f"  {name:<26} cold {cold * 1000:8.1f} ms   warm {warm * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def make_response():
+    """Factory for mock streamed responses yielding content in 1 KiB chunks."""
+
+    def factory(content: bytes, headers: dict[str, str] | None = None) -> MagicMock:
+        mock_response = MagicMock()
+        mock_response.headers = headers or {}
+        mock_response.is_redirect = False
+        mock_response.raise_for_status = MagicMock()
+        mock_response.raw.read1.side_effect = [
+            content[i : i + 1024] for i in range(0, len(content), 1024)
+        ] + [b""]
+        return mock_response
+
+    return factory
@@ -0,0 +1,107 @@
+import time
+from datetime import UTC, datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+import pytest
+
+from app.dates import format_rfc822, from_struct_time, parse_datetime
+
+
+class TestParseDatetime:
+    """Tests for shared date normalization."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2024-01-15T10:30:00+00:00",
+            "2024-01-15T10:30:00Z",
+            "2024-01-15T19:30:00+09:00",
+            "2024-01-15T05:30:00-05:00",
+            "2024-01-15T10:30:00.000Z",
+            "Mon, 15 Jan 2024 10:30:00 GMT",
+            "Mon, 15 Jan 2024 10:30:00 +0000",
+            "Mon, 15 Jan 2024 19:30:00 +0900",
+            "15 Jan 2024 05:30:00 -0500",
+        ],
+    )
+    def test_common_formats_are_normalized_to_same_instant(self, value):
+        expected = datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC)
+        dt = parse_datetime(value)
+
+        assert dt is not None
+        assert dt.tzinfo is not None
+        assert dt == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "Mon, 15 Jan 2024 10:30:00 GMT",
+            "Mon, 15 Jan 2024 19:30:00 +0900",
+            "Mon, 15 Jan 2024 05:00:00 -0530",
+            "5 Jan 2024 10:30 +0000",
+            "Mon, 15 Jan 2024 05:30:00 EST",
+            "Mon, 15 Jan 24 10:30:00 GMT",
+            "Mon,  15 Jan 2024 10:30:00 GMT",
+        ],
+    )
+    def test_rfc822_matches_email_utils(self, value):
+        expected = parsedate_to_datetime(value)
+        if expected.tzinfo is None:
+            expected = expected.replace(tzinfo=UTC)
+
+        dt = parse_datetime(value)
+
+        assert dt == expected
+        assert dt.utcoffset() == expected.utcoffset()
+
+    def test_original_offset_is_preserved(self):
+        dt = parse_datetime("2024-01-15T19:30:00+09:00")
+        assert dt.utcoffset() == timedelta(hours=9)
+
+    @pytest.mark.parametrize(
+        "value",
+        ["2024-01-15T10:30:00", "2024-01-15", "Mon, 15 Jan 2024 10:30:00 -0000"],
+    )
+    def test_naive_values_are_assumed_utc(self, value):
+        dt = parse_datetime(value)
+        assert dt.utcoffset() == timedelta(0)
+
+    @pytest.mark.parametrize("value", ["", "   ", "not a date", "2024-13-45T99:99:99Z"])
+    def test_invalid_values_return_none(self, value):
+        assert parse_datetime(value) is None
+
+
+class TestFromStructTime:
+    """Tests for feedparser struct_time conversion."""
+
+    @pytest.fixture
+    def local_timezone(self, monkeypatch):
+        # A non-UTC local timezone exposes conversions that treat UTC as local time
+        monkeypatch.setenv("TZ", "Asia/Tokyo")
+        time.tzset()
+        yield
+        monkeypatch.undo()
+        time.tzset()
+
+    def test_struct_time_is_treated_as_utc(self, local_timezone):
+        value = time.strptime("2024-01-15 10:30:00", "%Y-%m-%d %H:%M:%S")
+        assert from_struct_time(value) == datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC)
+
+
+class TestFormatRfc822:
+    """Tests for RFC 822 output formatting."""
+
+    def test_utc(self):
+        dt = datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC)
+        assert format_rfc822(dt) == "Mon, 15 Jan 2024 10:30:00 +0000"
+
+    @pytest.mark.parametrize(
+        "offset", [timedelta(0), timedelta(hours=9), timedelta(hours=-5, minutes=-30)]
+    )
+    def test_matches_email_utils(self, offset):
+        dt = datetime(999, 3, 5, 7, 8, 9, 123456, tzinfo=timezone(offset))
+        assert format_rfc822(dt) == format_datetime(dt)
+
+    def test_offset_is_kept(self):
+        dt = datetime(2024, 1, 15, 19, 30, 0, tzinfo=timezone(timedelta(hours=9)))
+        assert format_rfc822(dt) == "Mon, 15 Jan 2024 19:30:00 +0900"
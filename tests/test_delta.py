@@ -0,0 +1,225 @@
+import json
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import main as main_module
+from app.config import FeedConfig
+from app.delta import DeltaWriter, FeedDelta, compute_delta, parse_feed_items
+from app.feed_builder import FeedBuilder
+from app.models import NormalizedItem
+
+SOURCE_URLS = {
+    "source_a": "https://source-a.com/feed",
+    "source_b": "https://source-b.com/feed",
+}
+
+
+def make_item(n: int, title: str | None = None, source_id: str = "source_a") -> NormalizedItem:
+    return NormalizedItem(
+        source_id=source_id,
+        source_display_name=source_id,
+        title=title or f"Item {n}",
+        url=f"https://example.com/{n}",
+        published_at=datetime(2024, 1, n, 0, 0, 0, tzinfo=UTC),
+        description=f"Description {n}",
+    )
+
+
+@pytest.fixture
+def builder():
+    return FeedBuilder(
+        FeedConfig(
+            title="Test Feed",
+            description="Test feed description",
+            link="https://example.com/feed.xml",
+            language="en",
+            max_items=10,
+        )
+    )
+
+
+@pytest.fixture
+def snapshot_of(builder):
+    def build_snapshot(items):
+        return parse_feed_items(builder.build(items, SOURCE_URLS))
+
+    return build_snapshot
+
+
+class TestComputeDelta:
+    """Tests for delta computation between feed builds."""
+
+    def test_no_previous_items_reports_all_added(self, snapshot_of):
+        delta, snapshot = compute_delta({}, snapshot_of([make_item(1), make_item(2)]))
+
+        assert {item["guid"] for item in delta.added} == {
+            "https://example.com/1",
+            "https://example.com/2",
+        }
+        assert delta.updated == []
+        assert delta.removed == []
+        assert set(snapshot) == {"https://example.com/1", "https://example.com/2"}
+
+    def test_added_updated_and_removed(self, snapshot_of):
+        previous = snapshot_of([make_item(1), make_item(2)])
+        current = snapshot_of([make_item(2, title="Item 2 (edited)"), make_item(3)])
+        delta, _ = compute_delta(previous, current)
+
+        assert [item["guid"] for item in delta.added] == ["https://example.com/3"]
+        assert [item["guid"] for item in delta.updated] == ["https://example.com/2"]
+        assert delta.updated[0]["title"] == "Item 2 (edited)"
+        assert delta.removed == ["https://example.com/1"]
+
+    def test_unchanged_items_yield_empty_delta(self, snapshot_of):
+        items = [make_item(1), make_item(2)]
+        delta, _ = compute_delta(snapshot_of(items), snapshot_of(items))
+
+        assert delta.is_empty()
+
+    def test_failed_source_items_are_not_removed_or_re_added(self, snapshot_of):
+        first = snapshot_of([make_item(1), make_item(2, source_id="source_b")])
+
+        # source_b fails: its item is neither removed nor dropped from the snapshot
+        delta, snapshot = compute_delta(
+            first,
+            snapshot_of([make_item(1), make_item(3)]),
+            failed_source_urls={SOURCE_URLS["source_b"]},
+        )
+        assert [item["guid"] for item in delta.added] == ["https://example.com/3"]
+        assert delta.removed == []
+        assert "https://example.com/2" in snapshot
+
+        # source_b recovers: its item is not reported as new
+        delta, _ = compute_delta(
+            snapshot,
+            snapshot_of([make_item(1), make_item(2, source_id="source_b"), make_item(3)]),
+        )
+        assert delta.is_empty()
+
+
+class TestDeltaWriter:
+    """Tests for delta files, cursor index and snapshot."""
+
+    @pytest.fixture
+    def now(self):
+        return datetime(2024, 1, 20, 0, 0, 0, tzinfo=UTC)
+
+    def test_empty_delta_is_not_written(self, tmp_path, now):
+        writer = DeltaWriter(tmp_path / "deltas")
+
+        assert writer.write(FeedDelta(), {}, now=now) is None
+        assert not (tmp_path / "deltas").exists()
+
+    def test_sequence_increases_and_index_is_updated(self, tmp_path, now):
+        writer = DeltaWriter(tmp_path)
+
+        first = writer.write(FeedDelta(removed=["https://example.com/1"]), {}, now=now)
+        second = writer.write(FeedDelta(removed=["https://example.com/2"]), {}, now=now)
+
+        assert (first, second) == (1, 2)
+        index = json.loads((tmp_path / "index.json").read_text(encoding="utf-8"))
+        assert index["latest_sequence"] == 2
+        assert index["oldest_sequence"] == 1
+        assert [entry["sequence"] for entry in index["deltas"]] == [1, 2]
+
+        payload = json.loads((tmp_path / index["deltas"][1]["file"]).read_text(encoding="utf-8"))
+        assert payload["sequence"] == 2
+        assert payload["removed"] == ["https://example.com/2"]
+
+    def test_retention_drops_oldest_deltas(self, tmp_path, now):
+        writer = DeltaWriter(tmp_path, retention=2)
+        for n in range(3):
+            writer.write(FeedDelta(removed=[f"https://example.com/{n}"]), {}, now=now)
+
+        index = writer.load_index()
+        assert index["latest_sequence"] == 3
+        assert index["oldest_sequence"] == 2
+        assert not (tmp_path / "00000001.json").exists()
+        assert (tmp_path / "00000003.json").exists()
+
+    @pytest.mark.parametrize("content", ["{not json", '{"deltas": []}', "[]"])
+    def test_corrupt_index_is_rebuilt_from_delta_files(self, tmp_path, now, content):
+        writer = DeltaWriter(tmp_path)
+        writer.write(FeedDelta(removed=["https://example.com/1"]), {}, now=now)
+        writer.write(FeedDelta(removed=["https://example.com/2"]), {}, now=now)
+        (tmp_path / "index.json").write_text(content, encoding="utf-8")
+
+        sequence = writer.write(FeedDelta(removed=["https://example.com/3"]), {}, now=now)
+
+        assert sequence == 3
+        assert [entry["sequence"] for entry in writer.load_index()["deltas"]] == [1, 2, 3]
+
+    def test_previous_items_come_from_snapshot(self, tmp_path, now, snapshot_of):
+        writer = DeltaWriter(tmp_path / "deltas")
+        snapshot = snapshot_of([make_item(1)])
+        writer.write(FeedDelta(added=list(snapshot.values())), snapshot, now=now)
+
+        assert writer.load_previous_items(tmp_path / "feed.xml") == snapshot
+
+    def test_previous_items_fall_back_to_feed(self, tmp_path, builder):
+        feed_path = tmp_path / "feed.xml"
+        feed_path.write_text(builder.build([make_item(1)], SOURCE_URLS), encoding="utf-8")
+
+        previous = DeltaWriter(tmp_path / "deltas").load_previous_items(feed_path)
+
+        assert list(previous) == ["https://example.com/1"]
+
+    @pytest.mark.parametrize("content", ["{not json", "[]", '{"guid": "not a dict"}'])
+    def test_corrupt_snapshot_falls_back_to_feed(self, tmp_path, builder, content):
+        feed_path = tmp_path / "feed.xml"
+        feed_path.write_text(builder.build([make_item(1)], SOURCE_URLS), encoding="utf-8")
+        writer = DeltaWriter(tmp_path / "deltas")
+        writer.output_dir.mkdir()
+        writer.snapshot_path.write_text(content, encoding="utf-8")
+
+        previous = writer.load_previous_items(feed_path)
+        delta, _ = compute_delta(previous, parse_feed_items(feed_path.read_text(encoding="utf-8")))
+
+        assert list(previous) == ["https://example.com/1"]
+        assert delta.is_empty()
+
+    def test_unparseable_previous_feed_is_treated_as_empty(self, tmp_path):
+        feed_path = tmp_path / "feed.xml"
+        feed_path.write_text("<rss><channel>", encoding="utf-8")
+
+        assert DeltaWriter(tmp_path / "deltas").load_previous_items(feed_path) == {}
+
+
+class TestMainDeltaOrdering:
+    """Tests that a delta failure leaves the previous feed in place."""
+
+    def test_feed_is_not_replaced_when_delta_write_fails(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "config.yaml").write_text(
+            """
+feed:
+  title: "Test Feed"
+  description: "Test"
+  link: "https://example.com/feed.xml"
+  language: "en"
+sources:
+  - id: "source_a"
+    type: "generic_rss"
+    display_name: "Source A"
+    rss_url: "https://source-a.com/feed"
+""",
+            encoding="utf-8",
+        )
+        feed_path = tmp_path / "docs" / "feed.xml"
+        feed_path.parent.mkdir()
+        feed_path.write_text("previous", encoding="utf-8")
+
+        fetcher = MagicMock()
+        fetcher.fetch.return_value = [make_item(1)]
+        fetcher.source_url = SOURCE_URLS["source_a"]
+
+        with (
+            patch.object(main_module, "create_fetcher", return_value=fetcher),
+            patch.object(DeltaWriter, "write", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            main_module.main()
+
+        assert feed_path.read_text(encoding="utf-8") == "previous"
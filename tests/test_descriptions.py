@@ -0,0 +1,120 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from app.config import DescriptionPolicy, _load_description_policy
+from app.descriptions import apply_description_policy, strip_html, truncate
+from app.models import NormalizedItem
+
+
+class TestStripHtml:
+    """Tests for HTML to text conversion."""
+
+    def test_removes_tags_and_collapses_whitespace(self):
+        html = "<p>Hello <b>world</b></p>\n\n<p>Second   paragraph</p>"
+        assert strip_html(html) == "Hello world Second paragraph"
+
+    def test_unescapes_entities(self):
+        assert strip_html("Fish &amp; chips &lt;3") == "Fish & chips <3"
+
+    def test_inline_tags_do_not_add_whitespace(self):
+        html = "un<em>believ</em>able, <a href=x>link</a>."
+        assert strip_html(html) == "unbelievable, link."
+
+    def test_block_tags_separate_text(self):
+        assert strip_html("<p>One</p><p>Two<br>Three</p><ul><li>a</li><li>b</li></ul>") == (
+            "One Two Three a b"
+        )
+
+    def test_skips_script_and_style(self):
+        html = "<style>p { color: red }</style><p>Text</p><script>alert(1)</script>"
+        assert strip_html(html) == "Text"
+
+
+class TestTruncate:
+    """Tests for word-boundary truncation."""
+
+    def test_short_text_is_unchanged(self):
+        assert truncate("short text", 20) == "short text"
+
+    def test_cuts_at_word_boundary(self):
+        result = truncate("The quick brown fox jumps over the lazy dog", 20)
+        assert result == "The quick brown fox…"
+        assert len(result) <= 20
+
+    def test_text_without_spaces_is_cut_hard(self):
+        result = truncate("あいうえおかきくけこさしすせそ", 6)
+        assert result == "あいうえお…"
+
+
+class TestApplyDescriptionPolicy:
+    """Tests for per-source description policies."""
+
+    @pytest.fixture
+    def sample_items(self):
+        return [
+            NormalizedItem(
+                source_id="source",
+                source_display_name="Source",
+                title="Item",
+                url="https://example.com/1",
+                published_at=datetime(2024, 1, 15, 10, 0, 0, tzinfo=UTC),
+                description="<p>Full <em>article</em> body goes here</p>",
+            ),
+            NormalizedItem(
+                source_id="source",
+                source_display_name="Source",
+                title="Item without description",
+                url="https://example.com/2",
+                published_at=datetime(2024, 1, 14, 10, 0, 0, tzinfo=UTC),
+                description=None,
+            ),
+        ]
+
+    def test_raw_policy_keeps_items(self, sample_items):
+        assert apply_description_policy(sample_items, DescriptionPolicy()) is sample_items
+
+    def test_text_policy_with_max_length(self, sample_items):
+        policy = DescriptionPolicy(mode="text", max_length=15)
+        result = apply_description_policy(sample_items, policy)
+
+        assert result[0].description == "Full article…"
+        assert result[1].description is None
+        # Original items are not modified
+        assert sample_items[0].description.startswith("<p>")
+
+    def test_raw_policy_with_max_length_does_not_cut_markup(self, sample_items):
+        policy = DescriptionPolicy(mode="raw", max_length=15)
+        result = apply_description_policy(sample_items, policy)
+
+        assert result[0].description == "Full article…"
+
+    def test_raw_policy_keeps_markup_that_fits(self, sample_items):
+        policy = DescriptionPolicy(mode="raw", max_length=100)
+        result = apply_description_policy(sample_items, policy)
+
+        assert result[0].description == sample_items[0].description
+
+    def test_drop_policy(self, sample_items):
+        result = apply_description_policy(sample_items, DescriptionPolicy(mode="drop"))
+        assert all(item.description is None for item in result)
+
+    def test_unknown_mode_raises_error(self, sample_items):
+        with pytest.raises(ValueError, match="Unknown description_policy mode"):
+            apply_description_policy(sample_items, DescriptionPolicy(mode="summary"))
+
+
+class TestDescriptionPolicyConfig:
+    """Tests for loading description policies from config."""
+
+    def test_defaults(self):
+        assert _load_description_policy(None) == DescriptionPolicy()
+
+    def test_invalid_mode_is_rejected(self):
+        with pytest.raises(ValueError, match="description_policy.mode"):
+            _load_description_policy({"mode": "summary"})
+
+    @pytest.mark.parametrize("max_length", [0, -5, "300", 1.5, True])
+    def test_invalid_max_length_is_rejected(self, max_length):
+        with pytest.raises(ValueError, match="description_policy.max_length"):
+            _load_description_policy({"mode": "text", "max_length": max_length})
@@ -3,7 +3,8 @@ from datetime import UTC, datetime
 
 import pytest
 
-from app.config import FeedConfig
+from app.config import FeedConfig, load_config
+from app.delta import compute_delta, parse_feed_items
 from app.feed_builder import FeedBuilder
 from app.models import NormalizedItem
 
@@ -160,3 +161,181 @@ class TestFeedBuilder:
         assert len(items) == 0
         # Channel metadata should still be present
         assert channel.find("title").text == "Test Feed"
+
+    def test_max_bytes_trims_descriptions_before_dropping_items(self, feed_config):
+        items = [
+            NormalizedItem(
+                source_id="source",
+                source_display_name="Source",
+                title=f"Item {i}",
+                url=f"https://example.com/{i}",
+                published_at=datetime(2024, 1, i + 1, 0, 0, 0, tzinfo=UTC),
+                description="word " * 400,
+            )
+            for i in range(5)
+        ]
+
+        feed_config.max_bytes = 4000
+        builder = FeedBuilder(feed_config)
+        xml_str = builder.build(items)
+
+        assert len(xml_str.encode("utf-8")) <= 4000
+        root = ET.fromstring(xml_str.split("\n", 1)[1])
+        result_items = root.find("channel").findall("item")
+        assert len(result_items) == 5
+        assert builder.item_count == 5
+        assert all(len(item.find("description").text) < 2000 for item in result_items)
+
+    def test_max_bytes_drops_oldest_items_when_trimming_is_not_enough(self, feed_config):
+        items = [
+            NormalizedItem(
+                source_id="source",
+                source_display_name="Source",
+                title=f"Item {i}",
+                url=f"https://example.com/{i}",
+                published_at=datetime(2024, 1, i + 1, 0, 0, 0, tzinfo=UTC),
+                description=None,
+            )
+            for i in range(10)
+        ]
+
+        feed_config.max_bytes = 1000
+        builder = FeedBuilder(feed_config)
+        xml_str = builder.build(items)
+
+        assert len(xml_str.encode("utf-8")) <= 1000
+        root = ET.fromstring(xml_str.split("\n", 1)[1])
+        result_items = root.find("channel").findall("item")
+        assert 0 < len(result_items) < 10
+        assert builder.item_count == len(result_items)
+        # Newest items are kept
+        assert result_items[0].find("title").text == "Item 9"
+
+    def test_max_bytes_leaves_feed_under_budget_untouched(self, feed_config, sample_items):
+        for item in sample_items:
+            item.description = "word " * 3000
+
+        expected = parse_feed_items(FeedBuilder(feed_config).build(sample_items))
+        feed_config.max_bytes = 500_000
+        result = parse_feed_items(FeedBuilder(feed_config).build(sample_items))
+
+        assert result == expected
+
+    def test_max_bytes_trims_largest_descriptions_first(self, feed_config):
+        items = [
+            NormalizedItem(
+                source_id="source",
+                source_display_name="Source",
+                title=f"Item {i}",
+                url=f"https://example.com/{i}",
+                published_at=datetime(2024, 1, i + 1, 0, 0, 0, tzinfo=UTC),
+                description="word " * (400 if i == 0 else 10),
+            )
+            for i in range(3)
+        ]
+
+        feed_config.max_bytes = 1500
+        xml_str = FeedBuilder(feed_config).build(items)
+
+        assert len(xml_str.encode("utf-8")) <= 1500
+        descriptions = {
+            guid: fields["description"] for guid, fields in parse_feed_items(xml_str).items()
+        }
+        assert descriptions["https://example.com/0"].endswith("…")
+        assert descriptions["https://example.com/1"] == "word " * 10
+        assert descriptions["https://example.com/2"] == "word " * 10
+
+    def test_max_bytes_smaller_than_channel_metadata_raises_error(self, feed_config, sample_items):
+        feed_config.max_bytes = 100
+
+        with pytest.raises(ValueError, match="channel metadata alone"):
+            FeedBuilder(feed_config).build(sample_items)
+
+    def test_max_bytes_too_small_for_any_item_raises_error(self, feed_config, sample_items):
+        header_size = len(FeedBuilder(feed_config).build([]).encode("utf-8"))
+        feed_config.max_bytes = header_size + 10
+
+        with pytest.raises(ValueError, match="too small to fit any item"):
+            FeedBuilder(feed_config).build(sample_items)
+
+    def test_max_item_bytes_trimming_is_stable_across_builds(self, feed_config):
+        def make_items(count):
+            return [
+                NormalizedItem(
+                    source_id="source",
+                    source_display_name="Source",
+                    title=f"Item {i}",
+                    url=f"https://example.com/{i}",
+                    published_at=datetime(2024, 1, i + 1, 0, 0, 0, tzinfo=UTC),
+                    description="word " * 400,
+                )
+                for i in range(count)
+            ]
+
+        feed_config.max_item_bytes = 800
+        builder = FeedBuilder(feed_config)
+        previous = parse_feed_items(builder.build(make_items(4)))
+        current = parse_feed_items(builder.build(make_items(7)))
+        delta, _ = compute_delta(previous, current)
+
+        assert len(delta.added) == 3
+        assert delta.updated == []
+        assert delta.removed == []
+
+    def test_max_bytes_does_not_cut_html_markup(self, feed_config):
+        description = (
+            "<p>" + '<a href="https://example.com/very/long/path">word</a> ' * 200 + "</p>"
+        )
+        item = NormalizedItem(
+            source_id="source",
+            source_display_name="Source",
+            title="Item",
+            url="https://example.com/1",
+            published_at=datetime(2024, 1, 1, 0, 0, 0, tzinfo=UTC),
+            description=description,
+        )
+
+        feed_config.max_bytes = 1000
+        xml_str = FeedBuilder(feed_config).build([item])
+
+        root = ET.fromstring(xml_str.split("\n", 1)[1])
+        text = root.find("channel").find("item").find("description").text
+        assert "<" not in text
+        assert text.startswith("word word")
+        assert text.endswith("…")
+
+
+class TestFeedConfig:
+    """Tests for loading feed size limits from config."""
+
+    def write_config(self, tmp_path, feed_lines):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            f"""
+feed:
+  title: "Test Feed"
+  description: "Test"
+  link: "https://example.com/feed.xml"
+  language: "en"
+{feed_lines}
+sources: []
+""",
+            encoding="utf-8",
+        )
+        return config_path
+
+    def test_size_limits_are_loaded(self, tmp_path):
+        config = load_config(
+            self.write_config(tmp_path, "  max_bytes: 500000\n  max_item_bytes: 20000")
+        )
+
+        assert config.feed.max_bytes == 500_000
+        assert config.feed.max_item_bytes == 20_000
+
+    @pytest.mark.parametrize("key", ["max_bytes", "max_item_bytes"])
+    @pytest.mark.parametrize("value", ['"500000"', "0", "-1", "true"])
+    def test_invalid_size_limits_are_rejected(self, tmp_path, key, value):
+        config_path = self.write_config(tmp_path, f"  {key}: {value}")
+
+        with pytest.raises(ValueError, match=f"feed.{key} must be a positive integer"):
+            load_config(config_path)
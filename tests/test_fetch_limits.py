@@ -0,0 +1,274 @@
+import gzip
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from app.config import FetchConfig, SourceConfig, load_config
+from app.sources.base import ResponseLimitError
+from app.sources.generic_rss import GenericRSSFetcher
+
+SAMPLE_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Test Feed</title>
+    <item>
+      <title>RSS Item Title</title>
+      <link>https://example.com/post/1</link>
+      <pubDate>Mon, 15 Jan 2024 10:30:00 GMT</pubDate>
+    </item>
+  </channel>
+</rss>"""
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    """Serves a large response 8 bytes at a time, every 0.2s.
+
+    The slow-headers variant sends one header line every 0.2s for 3s, then
+    closes the connection without finishing the headers.
+    """
+
+    def do_GET(self):
+        try:
+            if self.path.endswith("slow-headers"):
+                self.wfile.write(b"HTTP/1.1 200 OK\r\n")
+                for i in range(15):
+                    self.wfile.write(f"X-Slow-{i}: 1\r\n".encode())
+                    self.wfile.flush()
+                    time.sleep(0.2)
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Length", "400")
+            self.end_headers()
+            for _ in range(50):
+                self.wfile.write(b"x" * 8)
+                self.wfile.flush()
+                time.sleep(0.2)
+        except OSError:
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _RedirectHandler(BaseHTTPRequestHandler):
+    """Redirects with a gzip bomb as the redirect body, then serves SAMPLE_RSS."""
+
+    BOMB = gzip.compress(b"\0" * 50_000_000)
+
+    def do_GET(self):
+        if self.path == "/feed.xml":
+            self._send(200, SAMPLE_RSS)
+        elif self.path == "/bomb.xml":
+            self._send(200, self.BOMB, {"Content-Encoding": "gzip"})
+        elif self.path == "/loop":
+            self._send(302, self.BOMB, {"Location": "/loop", "Content-Encoding": "gzip"})
+        else:
+            target = "/bomb.xml" if self.path == "/to-bomb" else "/feed.xml"
+            self._send(302, self.BOMB, {"Location": target, "Content-Encoding": "gzip"})
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except OSError:
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _fetch_threads():
+    return [t for t in threading.enumerate() if t.name == "fetch-test_rss"]
+
+
+def _serve(handler_class):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler_class)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def slow_server():
+    yield from _serve(_SlowHandler)
+
+
+@pytest.fixture
+def redirect_server():
+    yield from _serve(_RedirectHandler)
+
+
+class TestFetchLimits:
+    """Tests for streamed download size and time limits."""
+
+    @pytest.fixture
+    def rss_config(self):
+        return SourceConfig(
+            id="test_rss",
+            type="generic_rss",
+            display_name="Test RSS Feed",
+            enabled=True,
+            rss_url="https://example.com/feed.xml",
+            fetch=FetchConfig(max_response_bytes=10_000, deadline_seconds=5),
+        )
+
+    @patch("app.sources.base._FetchSession.get")
+    def test_request_is_streamed_with_bounded_timeout(self, mock_get, rss_config, make_response):
+        mock_get.return_value = make_response(SAMPLE_RSS)
+
+        GenericRSSFetcher(rss_config).fetch()
+
+        kwargs = mock_get.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["allow_redirects"] is False
+        assert kwargs["timeout"] == 5
+        mock_get.return_value.close.assert_called_once()
+
+    @patch("app.sources.base._FetchSession.get")
+    def test_content_length_over_limit_is_rejected(self, mock_get, rss_config, make_response):
+        mock_get.return_value = make_response(SAMPLE_RSS, {"Content-Length": "20000"})
+
+        with pytest.raises(ResponseLimitError, match="Content-Length"):
+            GenericRSSFetcher(rss_config).fetch()
+        mock_get.return_value.raw.read1.assert_not_called()
+
+    @patch("app.sources.base._FetchSession.get")
+    def test_streamed_body_over_limit_is_rejected(self, mock_get, rss_config, make_response):
+        mock_get.return_value = make_response(b"x" * 20_000)
+
+        with pytest.raises(ResponseLimitError, match="too large"):
+            GenericRSSFetcher(rss_config).fetch()
+        mock_get.return_value.close.assert_called_once()
+
+    @patch("app.sources.base._FetchSession.get")
+    def test_gzip_body_is_decompressed(self, mock_get, rss_config, make_response):
+        mock_get.return_value = make_response(
+            gzip.compress(SAMPLE_RSS), {"Content-Encoding": "gzip"}
+        )
+
+        items = GenericRSSFetcher(rss_config).fetch()
+
+        assert [item.title for item in items] == ["RSS Item Title"]
+
+    @patch("app.sources.base._FetchSession.get")
+    def test_gzip_bomb_is_rejected(self, mock_get, rss_config, make_response):
+        bomb = gzip.compress(b"\0" * 10_000_000)
+        assert len(bomb) < rss_config.fetch.max_response_bytes
+        mock_get.return_value = make_response(bomb, {"Content-Encoding": "gzip"})
+
+        with pytest.raises(ResponseLimitError, match="Decompressed response too large"):
+            GenericRSSFetcher(rss_config).fetch()
+
+    @patch("app.sources.base._FetchSession.get")
+    def test_unsupported_encoding_is_rejected(self, mock_get, rss_config, make_response):
+        mock_get.return_value = make_response(SAMPLE_RSS, {"Content-Encoding": "br"})
+
+        with pytest.raises(ResponseLimitError, match="Unsupported Content-Encoding"):
+            GenericRSSFetcher(rss_config).fetch()
+
+    def test_redirect_body_is_not_read(self, rss_config, redirect_server):
+        rss_config.rss_url = redirect_server + "start"
+
+        tracemalloc.start()
+        try:
+            items = GenericRSSFetcher(rss_config).fetch()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert [item.title for item in items] == ["RSS Item Title"]
+        assert peak < 5_000_000
+
+    def test_redirect_target_is_size_limited(self, rss_config, redirect_server):
+        rss_config.rss_url = redirect_server + "to-bomb"
+
+        with pytest.raises(ResponseLimitError, match="too large"):
+            GenericRSSFetcher(rss_config).fetch()
+
+    def test_redirect_loop_is_rejected(self, rss_config, redirect_server):
+        rss_config.rss_url = redirect_server + "loop"
+
+        with pytest.raises(ResponseLimitError, match="Too many redirects"):
+            GenericRSSFetcher(rss_config).fetch()
+
+    def test_deadline_caps_slowly_trickling_body(self, rss_config, slow_server):
+        rss_config.rss_url = slow_server
+        rss_config.fetch = FetchConfig(deadline_seconds=1)
+
+        started = time.monotonic()
+        with pytest.raises(ResponseLimitError, match="deadline"):
+            GenericRSSFetcher(rss_config).fetch()
+
+        assert time.monotonic() - started < 2
+
+        # The abandoned worker stops at its next read rather than reading on
+        time.sleep(0.5)
+        assert not _fetch_threads()
+
+    def test_deadline_caps_slowly_trickling_headers(self, rss_config, slow_server):
+        rss_config.rss_url = slow_server + "slow-headers"
+        rss_config.fetch = FetchConfig(deadline_seconds=1)
+
+        started = time.monotonic()
+        with pytest.raises(ResponseLimitError, match="deadline"):
+            GenericRSSFetcher(rss_config).fetch()
+
+        assert time.monotonic() - started < 2
+
+        # Known limit: a worker waiting for headers can't be interrupted, so it
+        # lingers until the server stops sending them
+        threads = _fetch_threads()
+        assert threads
+        for thread in threads:
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+
+
+class TestFetchConfig:
+    """Tests for global and per-source fetch limit configuration."""
+
+    def test_source_overrides_global_limits(self, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            """
+feed:
+  title: "Test Feed"
+  description: "Test"
+  link: "https://example.com/feed.xml"
+  language: "en"
+fetch:
+  max_response_bytes: 2000000
+sources:
+  - id: "a"
+    type: "generic_rss"
+    display_name: "A"
+    rss_url: "https://example.com/a.xml"
+  - id: "b"
+    type: "generic_rss"
+    display_name: "B"
+    rss_url: "https://example.com/b.xml"
+    fetch:
+      max_response_bytes: 500000
+      deadline_seconds: 10
+""",
+            encoding="utf-8",
+        )
+
+        config = load_config(config_path)
+
+        assert config.sources[0].fetch == FetchConfig(max_response_bytes=2_000_000)
+        assert config.sources[1].fetch == FetchConfig(
+            max_response_bytes=500_000, deadline_seconds=10
+        )
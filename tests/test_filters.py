@@ -0,0 +1,257 @@
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+
+from app import main as main_module
+from app.config import AppConfig, FeedConfig, FilterConfig, SourceConfig, _load_filter_config
+from app.filters import ItemFilter
+from app.models import NormalizedItem
+
+
+class TestItemFilter:
+    """Tests for include/exclude item filtering."""
+
+    @pytest.fixture
+    def now(self):
+        return datetime(2024, 1, 20, 0, 0, 0, tzinfo=UTC)
+
+    @pytest.fixture
+    def sample_items(self):
+        return [
+            NormalizedItem(
+                source_id="source_a",
+                source_display_name="Source A",
+                title="Python 3.12 released",
+                url="https://example.com/1",
+                published_at=datetime(2024, 1, 19, 10, 0, 0, tzinfo=UTC),
+                description="Release notes",
+            ),
+            NormalizedItem(
+                source_id="source_a",
+                source_display_name="Source A",
+                title="[Sponsored] Buy now",
+                url="https://example.com/2",
+                published_at=datetime(2024, 1, 18, 10, 0, 0, tzinfo=UTC),
+                description="Python merch",
+            ),
+            NormalizedItem(
+                source_id="source_a",
+                source_display_name="Source A",
+                title="Rust news",
+                url="https://example.com/3",
+                published_at=datetime(2023, 12, 1, 10, 0, 0, tzinfo=UTC),
+                description=None,
+            ),
+        ]
+
+    def test_no_rules_keeps_all_items(self, sample_items, now):
+        item_filter = ItemFilter(FilterConfig())
+        assert item_filter.apply(sample_items, now=now) == sample_items
+        assert not item_filter.hits
+
+    def test_exclude_keyword_is_case_insensitive(self, sample_items, now):
+        item_filter = ItemFilter(FilterConfig(exclude_keywords=["sponsored"]))
+        result = item_filter.apply(sample_items, now=now)
+
+        assert [item.url for item in result] == [
+            "https://example.com/1",
+            "https://example.com/3",
+        ]
+        assert item_filter.hits["exclude:sponsored"] == 1
+
+    def test_include_keyword_matches_description(self, sample_items, now):
+        item_filter = ItemFilter(FilterConfig(include_keywords=["merch"]))
+        result = item_filter.apply(sample_items, now=now)
+
+        assert [item.url for item in result] == ["https://example.com/2"]
+        assert item_filter.hits["include:merch"] == 1
+        assert item_filter.hits["include:<no match>"] == 2
+
+    def test_exclude_takes_precedence_over_include(self, sample_items, now):
+        item_filter = ItemFilter(
+            FilterConfig(include_keywords=["python"], exclude_patterns=[r"^\[sponsored\]"])
+        )
+        result = item_filter.apply(sample_items, now=now)
+
+        assert [item.url for item in result] == ["https://example.com/1"]
+        assert item_filter.hits[r"exclude:/^\[sponsored\]/"] == 1
+
+    def test_keywords_are_matched_literally(self, sample_items, now):
+        item_filter = ItemFilter(FilterConfig(exclude_keywords=["3.12"]))
+        result = item_filter.apply(sample_items, now=now)
+
+        assert "https://example.com/1" not in [item.url for item in result]
+        assert item_filter.hits["exclude:3.12"] == 1
+
+    @pytest.mark.parametrize(
+        "title",
+        [
+            "Python programming tips",
+            "Improving performance",
+            "April release notes",
+            "New product launch",
+        ],
+    )
+    def test_ascii_keyword_does_not_match_inside_words(self, now, title):
+        item = NormalizedItem(
+            source_id="source_a",
+            source_display_name="Source A",
+            title=title,
+            url="https://example.com/1",
+            published_at=now,
+            description=None,
+        )
+        item_filter = ItemFilter(FilterConfig(exclude_keywords=["PR"]))
+
+        assert item_filter.apply([item], now=now) == [item]
+
+    @pytest.mark.parametrize(
+        ("keyword", "text"),
+        [
+            ("PR", "[PR] New product"),
+            ("pr", "Sponsored (PR)"),
+            ("Python", "Python入門"),
+            ("広告", "新商品の広告です"),
+            ("C++", "C++20 features"),
+        ],
+    )
+    def test_keyword_matches_at_word_boundaries(self, keyword, text):
+        item_filter = ItemFilter(FilterConfig(exclude_keywords=[keyword]))
+
+        assert item_filter.exclude_regex.search(text)
+
+    def test_pattern_with_groups_reports_its_own_rule(self, sample_items, now):
+        item_filter = ItemFilter(
+            FilterConfig(exclude_patterns=[r"(go|java)lang", r"(rust|zig) (news)"])
+        )
+        item_filter.apply(sample_items, now=now)
+
+        assert item_filter.hits == {"exclude:/(rust|zig) (news)/": 1}
+
+    def test_max_age_days(self, sample_items, now):
+        item_filter = ItemFilter(FilterConfig(max_age_days=7))
+        result = item_filter.apply(sample_items, now=now)
+
+        assert len(result) == 2
+        assert item_filter.hits["max_age_days"] == 1
+
+    def test_source_rules_are_merged_with_global_rules(self, sample_items, now):
+        global_config = FilterConfig(exclude_keywords=["rust"], max_age_days=1)
+        source_config = FilterConfig(exclude_keywords=["sponsored"], max_age_days=365)
+        item_filter = ItemFilter(global_config, source_config)
+        result = item_filter.apply(sample_items, now=now)
+
+        assert [item.url for item in result] == ["https://example.com/1"]
+
+    def test_invalid_pattern_raises_error(self):
+        with pytest.raises(ValueError, match="Invalid filter pattern '\\(unclosed'"):
+            ItemFilter(FilterConfig(exclude_patterns=["(unclosed"]))
+
+    def test_numbered_backreference_is_rejected(self):
+        with pytest.raises(ValueError, match="numbered backreferences are not supported"):
+            ItemFilter(FilterConfig(exclude_patterns=[r"(\w)\1"]))
+
+    def test_named_backreference_is_supported(self):
+        item_filter = ItemFilter(
+            FilterConfig(exclude_patterns=["zzz", r"(?P<letter>[a-z])(?P=letter)"])
+        )
+
+        assert item_filter.exclude_regex.search("llama")
+        assert not item_filter.exclude_regex.search("lama")
+
+    def test_escaped_digit_in_character_class_is_not_a_backreference(self):
+        ItemFilter(FilterConfig(exclude_patterns=[r"[\1]x"]))
+
+    @pytest.mark.parametrize("pattern", ["(?s)python.+notes", "(?sx) python .+ notes # comment"])
+    def test_inline_flags_are_scoped_to_their_rule(self, sample_items, now, pattern):
+        item_filter = ItemFilter(FilterConfig(exclude_patterns=["zzz", pattern]))
+        result = item_filter.apply(sample_items, now=now)
+
+        assert "https://example.com/1" not in [item.url for item in result]
+
+    def test_empty_keyword_is_rejected(self):
+        with pytest.raises(ValueError, match="would match every item"):
+            ItemFilter(FilterConfig(include_keywords=[""]))
+
+
+class TestFilterConfig:
+    """Tests for loading filter rules from config."""
+
+    def test_single_string_is_wrapped_in_list(self):
+        config = _load_filter_config({"include_keywords": "Python"})
+        assert config.include_keywords == ["Python"]
+
+    def test_null_is_treated_as_empty(self):
+        config = _load_filter_config({"exclude_patterns": None})
+        assert config.exclude_patterns == []
+
+    @pytest.mark.parametrize("value", [123, {"a": "b"}, ["ok", 1], ["ok", ""]])
+    def test_invalid_values_are_rejected(self, value):
+        with pytest.raises(ValueError, match="filters.exclude_keywords"):
+            _load_filter_config({"exclude_keywords": value})
+
+    @pytest.mark.parametrize("value", ["30", 0, -1, True, 1.5])
+    def test_invalid_max_age_days_is_rejected(self, value):
+        with pytest.raises(ValueError, match="filters.max_age_days must be a positive integer"):
+            _load_filter_config({"max_age_days": value})
+
+
+class TestBuildItemFilters:
+    """Tests for compiling every source's filters before fetching."""
+
+    @pytest.fixture
+    def app_config(self):
+        return AppConfig(
+            feed=FeedConfig(
+                title="Test Feed",
+                description="Test",
+                link="https://example.com/feed.xml",
+                language="en",
+                max_items=10,
+            ),
+            sources=[
+                SourceConfig(
+                    id=source_id,
+                    type="generic_rss",
+                    display_name=source_id,
+                    enabled=True,
+                    rss_url=f"https://example.com/{source_id}.xml",
+                )
+                for source_id in ("source_a", "source_b")
+            ],
+        )
+
+    def test_filters_are_built_per_source(self, app_config):
+        app_config.sources[1].filters = FilterConfig(exclude_keywords=["rust"])
+
+        item_filters = main_module.build_item_filters(app_config, app_config.sources)
+
+        assert [f.exclude_rules for f in item_filters] == [[], ["rust"]]
+
+    def test_invalid_global_pattern_is_reported_once(self, app_config):
+        app_config.filters = FilterConfig(exclude_patterns=["(unclosed"])
+
+        with pytest.raises(ValueError, match=r"^Error: filters: Invalid filter pattern"):
+            main_module.build_item_filters(app_config, app_config.sources)
+
+    def test_conflicting_group_names_are_reported_for_the_source(self, app_config):
+        app_config.filters = FilterConfig(exclude_patterns=["(?P<word>ad)"])
+        app_config.sources[1].filters = FilterConfig(exclude_patterns=["(?P<word>pr)"])
+
+        with pytest.raises(ValueError, match=r"^Error: sources.source_b.filters: "):
+            main_module.build_item_filters(app_config, app_config.sources)
+
+    def test_main_exits_before_fetching(self, app_config, capsys):
+        app_config.filters = FilterConfig(exclude_patterns=["(unclosed"])
+
+        with (
+            patch.object(main_module, "load_config", return_value=app_config),
+            patch.object(main_module, "create_fetcher") as create_fetcher,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main_module.main()
+
+        assert exc_info.value.code == 1
+        assert "Invalid filter pattern" in capsys.readouterr().err
+        create_fetcher.assert_not_called()
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -40,12 +40,11 @@ class TestYouTubeFetcher:
   </entry>
 </feed>"""
 
-    @patch("app.sources.youtube.requests.get")
-    def test_fetch_returns_normalized_items(self, mock_get, youtube_config, sample_youtube_feed):
-        mock_response = MagicMock()
-        mock_response.content = sample_youtube_feed
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    @patch("app.sources.base._FetchSession.get")
+    def test_fetch_returns_normalized_items(
+        self, mock_get, youtube_config, sample_youtube_feed, make_response
+    ):
+        mock_get.return_value = make_response(sample_youtube_feed)
 
         fetcher = YouTubeFetcher(youtube_config)
         items = fetcher.fetch()
@@ -53,12 +52,11 @@ class TestYouTubeFetcher:
         assert len(items) == 2
         assert all(isinstance(item, NormalizedItem) for item in items)
 
-    @patch("app.sources.youtube.requests.get")
-    def test_item_fields_are_correct(self, mock_get, youtube_config, sample_youtube_feed):
-        mock_response = MagicMock()
-        mock_response.content = sample_youtube_feed
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    @patch("app.sources.base._FetchSession.get")
+    def test_item_fields_are_correct(
+        self, mock_get, youtube_config, sample_youtube_feed, make_response
+    ):
+        mock_get.return_value = make_response(sample_youtube_feed)
 
         fetcher = YouTubeFetcher(youtube_config)
         items = fetcher.fetch()
@@ -70,12 +68,11 @@ class TestYouTubeFetcher:
         assert first_item.url == "https://www.youtube.com/watch?v=abc123"
         assert first_item.description == "Test video description"
 
-    @patch("app.sources.youtube.requests.get")
-    def test_published_at_is_timezone_aware(self, mock_get, youtube_config, sample_youtube_feed):
-        mock_response = MagicMock()
-        mock_response.content = sample_youtube_feed
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    @patch("app.sources.base._FetchSession.get")
+    def test_published_at_is_timezone_aware(
+        self, mock_get, youtube_config, sample_youtube_feed, make_response
+    ):
+        mock_get.return_value = make_response(sample_youtube_feed)
 
         fetcher = YouTubeFetcher(youtube_config)
         items = fetcher.fetch()
@@ -130,12 +127,11 @@ class TestGenericRSSFetcher:
   </channel>
 </rss>"""
 
-    @patch("app.sources.generic_rss.requests.get")
-    def test_fetch_returns_normalized_items(self, mock_get, rss_config, sample_rss_feed):
-        mock_response = MagicMock()
-        mock_response.content = sample_rss_feed
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    @patch("app.sources.base._FetchSession.get")
+    def test_fetch_returns_normalized_items(
+        self, mock_get, rss_config, sample_rss_feed, make_response
+    ):
+        mock_get.return_value = make_response(sample_rss_feed)
 
         fetcher = GenericRSSFetcher(rss_config)
         items = fetcher.fetch()
@@ -143,12 +139,9 @@ class TestGenericRSSFetcher:
         assert len(items) == 2
         assert all(isinstance(item, NormalizedItem) for item in items)
 
-    @patch("app.sources.generic_rss.requests.get")
-    def test_item_fields_are_correct(self, mock_get, rss_config, sample_rss_feed):
-        mock_response = MagicMock()
-        mock_response.content = sample_rss_feed
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    @patch("app.sources.base._FetchSession.get")
+    def test_item_fields_are_correct(self, mock_get, rss_config, sample_rss_feed, make_response):
+        mock_get.return_value = make_response(sample_rss_feed)
 
         fetcher = GenericRSSFetcher(rss_config)
         items = fetcher.fetch()
@@ -160,12 +153,11 @@ class TestGenericRSSFetcher:
         assert first_item.url == "https://example.com/post/1"
         assert first_item.description == "RSS item description"
 
-    @patch("app.sources.generic_rss.requests.get")
-    def test_published_at_is_timezone_aware(self, mock_get, rss_config, sample_rss_feed):
-        mock_response = MagicMock()
-        mock_response.content = sample_rss_feed
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+    @patch("app.sources.base._FetchSession.get")
+    def test_published_at_is_timezone_aware(
+        self, mock_get, rss_config, sample_rss_feed, make_response
+    ):
+        mock_get.return_value = make_response(sample_rss_feed)
 
         fetcher = GenericRSSFetcher(rss_config)
         items = fetcher.fetch()